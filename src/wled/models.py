@@ -6,14 +6,21 @@ from dataclasses import dataclass
 from enum import IntEnum, IntFlag
 from functools import lru_cache
 from operator import attrgetter
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 from awesomeversion import AwesomeVersion
 
 from .exceptions import WLEDError
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 NAME_GETTER = attrgetter("name")
 
+# Shared read-only fallback for absent sections in WLED API responses.
+EMPTY_DATA: Mapping[str, Any] = MappingProxyType({})
+
 
 @lru_cache
 def get_awesome_version(version: str) -> AwesomeVersion:
@@ -21,7 +28,7 @@ def get_awesome_version(version: str) -> AwesomeVersion:
     return AwesomeVersion(version)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Nightlight:
     """Object holding nightlight state in WLED."""
 
@@ -44,26 +51,27 @@ class Nightlight:
             A Nightlight object.
 
         """
-        nightlight = data.get("nl", {})
+        nightlight = data.get("nl", EMPTY_DATA)
+        get = nightlight.get
 
         # Handle deprecated fade property for Nightlight
-        mode = nightlight.get("mode")
-        fade = nightlight.get("fade", False)
+        mode = get("mode")
+        fade = get("fade", False)
         if mode is not None:
             fade = mode != NightlightMode.INSTANT
         if mode is None:
             mode = NightlightMode.FADE if fade else NightlightMode.INSTANT
 
         return Nightlight(
-            duration=nightlight.get("dur", 1),
+            duration=get("dur", 1),
             fade=fade,
             mode=NightlightMode(mode),
-            on=nightlight.get("on", False),
-            target_brightness=nightlight.get("tbri", 0),
+            on=get("on", False),
+            target_brightness=get("tbri", 0),
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Sync:
     """Object holding sync state in WLED."""
 
@@ -83,11 +91,12 @@ class Sync:
             A sync object.
 
         """
-        sync = data.get("udpn", {})
-        return Sync(send=sync.get("send", False), receive=sync.get("recv", False))
+        sync = data.get("udpn", EMPTY_DATA)
+        get = sync.get
+        return Sync(send=get("send", False), receive=get("recv", False))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Effect:
     """Object holding an effect in WLED."""
 
@@ -95,7 +104,7 @@ class Effect:
     name: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Palette:
     """Object holding an palette in WLED.
 
@@ -113,7 +122,11 @@ class Palette:
     palette_id: int
 
 
-@dataclass
+UNKNOWN_EFFECT = Effect(effect_id=0, name="Unknown")
+UNKNOWN_PALETTE = Palette(palette_id=0, name="Unknown")
+
+
+@dataclass(slots=True)
 class Segment:
     """Object holding segment state in WLED.
 
@@ -149,10 +162,9 @@ class Segment:
     def from_dict(  # noqa: PLR0913
         segment_id: int,
         data: dict[str, Any],
-        *,
         effects: dict[int, Effect],
         palettes: dict[int, Palette],
-        state_on: bool,
+        state_on: bool,  # noqa: FBT001
         state_brightness: int,
     ) -> Segment:
         """Return Segment object from WLED API response.
@@ -171,45 +183,42 @@ class Segment:
             An Segment object.
 
         """
-        start = data.get("start", 0)
-        stop = data.get("stop", 0)
-        length = data.get("len", (stop - start))
+        get = data.get
+        start = get("start", 0)
+        stop = get("stop", 0)
+        if (length := get("len")) is None:
+            length = stop - start
 
-        colors = data.get("col", [])
-        primary_color, secondary_color, tertiary_color = (0, 0, 0)
-        try:
-            primary_color = tuple(colors.pop(0))  # type: ignore[assignment]
-            secondary_color = tuple(colors.pop(0))  # type: ignore[assignment]
-            tertiary_color = tuple(colors.pop(0))  # type: ignore[assignment]
-        except IndexError:
-            pass
+        colors = get("col", ())
+        num_colors = len(colors)
+        primary_color = tuple(colors[0]) if num_colors > 0 else (0, 0, 0)
+        secondary_color = tuple(colors[1]) if num_colors > 1 else (0, 0, 0)
+        tertiary_color = tuple(colors[2]) if num_colors > 2 else (0, 0, 0)
 
-        effect = effects.get(data.get("fx", 0)) or Effect(effect_id=0, name="Unknown")
-        palette = palettes.get(data.get("pal", 0)) or Palette(
-            palette_id=0, name="Unknown"
-        )
+        effect = effects.get(get("fx", 0), UNKNOWN_EFFECT)
+        palette = palettes.get(get("pal", 0), UNKNOWN_PALETTE)
 
         return Segment(
-            brightness=data.get("bri", state_brightness),
-            clones=data.get("cln", -1),
-            color_primary=primary_color,  # type: ignore[arg-type]
-            color_secondary=secondary_color,  # type: ignore[arg-type]
-            color_tertiary=tertiary_color,  # type: ignore[arg-type]
+            brightness=get("bri", state_brightness),
+            clones=get("cln", -1),
+            color_primary=primary_color,
+            color_secondary=secondary_color,
+            color_tertiary=tertiary_color,
             effect=effect,
-            intensity=data.get("ix", 0),
+            intensity=get("ix", 0),
             length=length,
-            on=data.get("on", state_on),
+            on=get("on", state_on),
             palette=palette,
-            reverse=data.get("rev", False),
+            reverse=get("rev", False),
             segment_id=segment_id,
-            selected=data.get("sel", False),
-            speed=data.get("sx", 0),
+            selected=get("sel", False),
+            speed=get("sx", 0),
             start=start,
             stop=stop,
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Leds:
     """Object holding leds info from WLED."""
 
@@ -237,7 +246,8 @@ class Leds:
             A Leds object.
 
         """
-        leds = data.get("leds", {})
+        leds = data.get("leds", EMPTY_DATA)
+        get = leds.get
 
         light_capabilities = None
         segment_light_capabilities = None
@@ -248,20 +258,20 @@ class Leds:
             ]
 
         return Leds(
-            cct=bool(leds.get("cct")),
-            count=leds.get("count", 0),
-            fps=leds.get("fps", None),
+            cct=bool(get("cct")),
+            count=get("count", 0),
+            fps=get("fps", None),
             light_capabilities=light_capabilities,
-            max_power=leds.get("maxpwr", 0),
-            max_segments=leds.get("maxseg", 0),
-            power=leds.get("pwr", 0),
-            rgbw=leds.get("rgbw", False),
+            max_power=get("maxpwr", 0),
+            max_segments=get("maxseg", 0),
+            power=get("pwr", 0),
+            rgbw=get("rgbw", False),
             segment_light_capabilities=segment_light_capabilities,
-            wv=bool(leds.get("wv", True)),
+            wv=bool(get("wv", True)),
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Wifi:
     """Object holding Wi-Fi information from WLED.
 
@@ -295,16 +305,17 @@ class Wifi:
         """
         if "wifi" not in data:
             return None
-        wifi = data.get("wifi", {})
+        wifi = data["wifi"]
+        get = wifi.get
         return Wifi(
-            bssid=wifi.get("bssid", "00:00:00:00:00:00"),
-            channel=wifi.get("channel", 0),
-            rssi=wifi.get("rssi", 0),
-            signal=wifi.get("signal", 0),
+            bssid=get("bssid", "00:00:00:00:00:00"),
+            channel=get("channel", 0),
+            rssi=get("rssi", 0),
+            signal=get("signal", 0),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Filesystem:
     """Object holding Filesystem information from WLED.
 
@@ -338,7 +349,7 @@ class Filesystem:
         """
         if "fs" not in data:
             return None
-        filesystem = data.get("fs", {})
+        filesystem = data["fs"]
         total = filesystem.get("t", 1)
         used = filesystem.get("u", 1)
         return Filesystem(
@@ -349,7 +360,7 @@ class Filesystem:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Info:  # pylint: disable=too-many-instance-attributes
     """Object holding information from WLED."""
 
@@ -391,21 +402,22 @@ class Info:  # pylint: disable=too-many-instance-attributes
             A info object.
 
         """
-        if (websocket := data.get("ws")) == -1:
+        get = data.get
+        if (websocket := get("ws")) == -1:
             websocket = None
 
-        if version := data.get("ver"):
+        if version := get("ver"):
             version = get_awesome_version(version)
             if not version.valid:
                 version = None
 
-        if version_latest_stable := data.get("version_latest_stable"):
+        if version_latest_stable := get("version_latest_stable"):
             version_latest_stable = get_awesome_version(version_latest_stable)
 
-        if version_latest_beta := data.get("version_latest_beta"):
+        if version_latest_beta := get("version_latest_beta"):
             version_latest_beta = get_awesome_version(version_latest_beta)
 
-        arch = data.get("arch", "Unknown")
+        arch = get("arch", "Unknown")
         if (
             (filesystem := Filesystem.from_dict(data)) is not None
             and arch == "esp8266"
@@ -418,24 +430,24 @@ class Info:  # pylint: disable=too-many-instance-attributes
 
         return Info(
             architecture=arch,
-            arduino_core_version=data.get("core", "Unknown").replace("_", "."),
-            brand=data.get("brand", "WLED"),
-            build_type=data.get("btype", "Unknown"),
-            effect_count=data.get("fxcount", 0),
+            arduino_core_version=get("core", "Unknown").replace("_", "."),
+            brand=get("brand", "WLED"),
+            build_type=get("btype", "Unknown"),
+            effect_count=get("fxcount", 0),
             filesystem=filesystem,
-            free_heap=data.get("freeheap", 0),
-            ip=data.get("ip", "Unknown"),
+            free_heap=get("freeheap", 0),
+            ip=get("ip", "Unknown"),
             leds=Leds.from_dict(data),
-            live_ip=data.get("lip", "Unknown"),
-            live_mode=data.get("lm", "Unknown"),
-            live=data.get("live", False),
-            mac_address=data.get("mac", ""),
-            name=data.get("name", "WLED Light"),
-            pallet_count=data.get("palcount", 0),
-            product=data.get("product", "DIY Light"),
-            udp_port=data.get("udpport", 0),
-            uptime=data.get("uptime", 0),
-            version_id=data.get("vid", "Unknown"),
+            live_ip=get("lip", "Unknown"),
+            live_mode=get("lm", "Unknown"),
+            live=get("live", False),
+            mac_address=get("mac", ""),
+            name=get("name", "WLED Light"),
+            pallet_count=get("palcount", 0),
+            product=get("product", "DIY Light"),
+            udp_port=get("udpport", 0),
+            uptime=get("uptime", 0),
+            version_id=get("vid", "Unknown"),
             version=version,
             version_latest_beta=version_latest_beta,
             version_latest_stable=version_latest_stable,
@@ -444,7 +456,7 @@ class Info:  # pylint: disable=too-many-instance-attributes
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class State:
     """Object holding the state of WLED."""
 
@@ -503,24 +515,19 @@ class State:
             A State object.
 
         """
-        brightness = data.get("bri", 1)
-        on = data.get("on", False)
-        lor = data.get("lor", 0)
+        get = data.get
+        brightness = get("bri", 1)
+        on = get("on", False)
+        lor = get("lor", 0)
 
+        segment_from_dict = Segment.from_dict
         segments = [
-            Segment.from_dict(
-                segment_id=segment_id,
-                data=segment,
-                effects=effects,
-                palettes=palettes,
-                state_on=on,
-                state_brightness=brightness,
-            )
-            for segment_id, segment in enumerate(data.get("seg", []))
+            segment_from_dict(segment_id, segment, effects, palettes, on, brightness)
+            for segment_id, segment in enumerate(get("seg", ()))
         ]
 
-        playlist = data.get("pl", -1)
-        preset = data.get("ps", -1)
+        playlist = get("pl", -1)
+        preset = get("ps", -1)
         if presets:
             playlist = playlists.get(playlist)
             preset = presets.get(preset)
@@ -533,12 +540,12 @@ class State:
             preset=preset,
             segments=segments,
             sync=Sync.from_dict(data),
-            transition=data.get("transition", 0),
+            transition=get("transition", 0),
             lor=Live(lor),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Preset:
     """Object representing a WLED preset."""
 
@@ -606,7 +613,7 @@ class Preset:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaylistEntry:
     """Object representing a entry in a WLED playlist."""
 
@@ -616,7 +623,7 @@ class PlaylistEntry:
     transition: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Playlist:
     """Object representing a WLED playlist."""
 
@@ -676,6 +683,21 @@ class Playlist:
 class Device:
     """Object holding all information of WLED."""
 
+    __slots__ = (
+        "_effects_data",
+        "_indexed_effects",
+        "_indexed_palettes",
+        "_indexed_playlists",
+        "_indexed_presets",
+        "_palettes_data",
+        "effects",
+        "info",
+        "palettes",
+        "playlists",
+        "presets",
+        "state",
+    )
+
     effects: list[Effect]
     info: Info
     palettes: list[Palette]
@@ -700,6 +722,8 @@ class Device:
         self._indexed_palettes: dict[int, Palette] = {}
         self._indexed_presets: dict[int, Preset] = {}
         self._indexed_playlists: dict[int, Playlist] = {}
+        self._effects_data: list[str] = []
+        self._palettes_data: list[str] = []
 
         self.effects = []
         self.palettes = []
@@ -707,10 +731,7 @@ class Device:
         self.presets = []
 
         # Check if all elements are in the passed dict, else raise an Error
-        if any(
-            k not in data and data[k] is not None
-            for k in ("effects", "palettes", "info", "state")
-        ):
+        if any(data.get(k) is None for k in ("effects", "palettes", "info", "state")):
             msg = "WLED data is incomplete, cannot construct device object"
             raise WLEDError(msg)
         self.update_from_dict(data)
@@ -728,14 +749,17 @@ class Device:
             The updated Device object.
 
         """
-        if _effects := data.get("effects"):
+        # Effects and palettes are fixed per firmware, only rebuild on change.
+        if (_effects := data.get("effects")) and _effects != self._effects_data:
+            self._effects_data = _effects
             self._indexed_effects = {
                 effect_id: Effect(effect_id=effect_id, name=effect)
                 for effect_id, effect in enumerate(_effects)
             }
             self.effects = sorted(self._indexed_effects.values(), key=NAME_GETTER)
 
-        if _palettes := data.get("palettes"):
+        if (_palettes := data.get("palettes")) and _palettes != self._palettes_data:
+            self._palettes_data = _palettes
             self._indexed_palettes = {
                 palette_id: Palette(palette_id=palette_id, name=palette)
                 for palette_id, palette in enumerate(_palettes)
@@ -275,7 +275,8 @@ class WLED:
 
             with suppress(WLEDError):
                 versions = await self.get_wled_versions_from_github()
-                data["info"].update(versions)
+                if info := data.get("info"):
+                    info.update(versions)
 
             self._device = Device(data)
 
@@ -336,7 +337,8 @@ class WLED:
 
         with suppress(WLEDError):
             versions = await self.get_wled_versions_from_github()
-            state_info["info"].update(versions)
+            if info := state_info.get("info"):
+                info.update(versions)
 
         self._device.update_from_dict(state_info)
 
@@ -0,0 +1,128 @@
+"""Tests for `wled.models`."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from wled.exceptions import WLEDError
+from wled.models import (
+    UNKNOWN_EFFECT,
+    UNKNOWN_PALETTE,
+    Device,
+    Effect,
+    Palette,
+    Segment,
+)
+
+
+@pytest.mark.parametrize(
+    ("colors", "expected"),
+    [
+        ([], ((0, 0, 0), (0, 0, 0), (0, 0, 0))),
+        ([[255, 0, 0]], ((255, 0, 0), (0, 0, 0), (0, 0, 0))),
+        (
+            [[255, 0, 0], [0, 255, 0, 10]],
+            ((255, 0, 0), (0, 255, 0, 10), (0, 0, 0)),
+        ),
+        (
+            [[255, 0, 0], [0, 255, 0], [0, 0, 255]],
+            ((255, 0, 0), (0, 255, 0), (0, 0, 255)),
+        ),
+    ],
+)
+def test_segment_colors(
+    colors: list[list[int]],
+    expected: tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...]],
+) -> None:
+    """Test segment colors default to black and leave the input untouched."""
+    data: dict[str, Any] = {"col": [list(color) for color in colors]}
+    segment = Segment.from_dict(0, data, {}, {}, state_on=True, state_brightness=1)
+
+    assert (
+        segment.color_primary,
+        segment.color_secondary,
+        segment.color_tertiary,
+    ) == expected
+    assert data["col"] == colors
+
+
+def test_segment_effect_and_palette() -> None:
+    """Test segment effect and palette lookup, with fallbacks."""
+    effects = {1: Effect(effect_id=1, name="Blink")}
+    palettes = {2: Palette(palette_id=2, name="Party")}
+
+    segment = Segment.from_dict(
+        0, {"fx": 1, "pal": 2}, effects, palettes, state_on=True, state_brightness=1
+    )
+    assert segment.effect is effects[1]
+    assert segment.palette is palettes[2]
+
+    segment = Segment.from_dict(
+        0, {"fx": 9, "pal": 9}, effects, palettes, state_on=True, state_brightness=1
+    )
+    assert segment.effect is UNKNOWN_EFFECT
+    assert segment.palette is UNKNOWN_PALETTE
+
+
+def test_segment_length() -> None:
+    """Test segment length is taken from len, or derived from start/stop."""
+    segment = Segment.from_dict(
+        0, {"start": 2, "stop": 10}, {}, {}, state_on=True, state_brightness=1
+    )
+    assert segment.length == 8
+
+    segment = Segment.from_dict(
+        0, {"start": 2, "stop": 10, "len": 4}, {}, {}, state_on=True, state_brightness=1
+    )
+    assert segment.length == 4
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"effects": [], "palettes": [], "state": {}},
+        {"effects": [], "palettes": [], "info": None, "state": {}},
+    ],
+)
+def test_device_incomplete_data(data: dict[str, Any]) -> None:
+    """Test a Device cannot be constructed from incomplete data."""
+    with pytest.raises(WLEDError):
+        Device(data)
+
+
+def test_device_effects_palettes_rebuilt_on_change() -> None:
+    """Test effects and palettes are only rebuilt when their payload changes."""
+    device = Device(
+        {
+            "effects": ["Solid", "Blink"],
+            "palettes": ["Default", "Autumn"],
+            "info": {},
+            "state": {},
+        }
+    )
+    effects = device.effects
+    palettes = device.palettes
+    indexed_effects = device._indexed_effects
+    indexed_palettes = device._indexed_palettes
+    assert [effect.name for effect in effects] == ["Blink", "Solid"]
+    assert [palette.name for palette in palettes] == ["Autumn", "Default"]
+
+    device.update_from_dict(
+        {"effects": ["Solid", "Blink"], "palettes": ["Default", "Autumn"]}
+    )
+    assert device.effects is effects
+    assert device.palettes is palettes
+    assert device._indexed_effects is indexed_effects
+    assert device._indexed_palettes is indexed_palettes
+
+    device.update_from_dict(
+        {"effects": ["Solid", "Blink", "Android"], "palettes": ["Default", "Jazzy"]}
+    )
+    assert device.effects is not effects
+    assert device.palettes is not palettes
+    assert [effect.name for effect in device.effects] == ["Android", "Blink", "Solid"]
+    assert [palette.name for palette in device.palettes] == ["Default", "Jazzy"]
+    assert device._indexed_effects[2].name == "Android"
+    assert device._indexed_palettes[1].name == "Jazzy"
@@ -765,3 +765,32 @@ async def test_detect_esp02(
         wled = WLED("example.com", session=session)
         device = await wled.update()
         assert device.info.architecture == "esp02"
+
+
+@pytest.mark.asyncio
+async def test_incomplete_full_response(aresponses: ResponsesMockServer) -> None:
+    """Test incomplete full data response is handled correctly."""
+    aresponses.add(
+        "example.com",
+        "/json",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text='{"state": {"on": true}, "effects": [], "palettes": []}',
+        ),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        wled = WLED("example.com", session=session)
+        with (
+            patch(
+                "wled.WLED.get_wled_versions_from_github",
+                return_value={
+                    "version_latest_stable": "0.14.0",
+                    "version_latest_beta": "0.15.0b1",
+                },
+            ),
+            pytest.raises(WLEDError),
+        ):
+            await wled.update()